@@ -0,0 +1,129 @@
+"""离线基准测试用的假 7z 可执行程序
+
+只实现 un7z.py / cpr7z.py 用到的两个命令：
+  x  解压：  fake7z x [-p密码] -y -o<输出目录> <压缩包>
+  a  压缩：  fake7z a [-t格式] [-mx等级] [-p密码] [-mhe=on] [-v分卷] <压缩包> <源目录>
+
+"压缩包"是一个 JSON 文件，只记录密码和文件清单（文件名 -> 字节数），
+解压时按清单写出等大小的零字节文件，因此无需真正的 7z 即可测量调度开销。
+
+行为通过环境变量配置：
+  FAKE7Z_LATENCY        每次调用的固定延迟（秒，默认 0）
+  FAKE7Z_MBPS           模拟吞吐量（MB/s，按清单总字节数计算额外延迟；默认 0 表示不限速）
+  FAKE7Z_WRONG_LATENCY  密码错误时额外延迟（秒，默认 0），模拟未加密文件名时需读完数据才能发现密码错误
+
+退出码与 7z 一致：0 成功，2 致命错误（密码错误/压缩包损坏），7 命令行错误。
+"""
+import os
+import sys
+import json
+import time
+import stat
+
+MAGIC = "fake7z/1"
+
+
+def write_archive(path, files, password=None):
+    """写出假压缩包；files 为 {相对路径: 字节数}"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"format": MAGIC, "password": password, "files": files}, f)
+
+
+def read_archive(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("format") != MAGIC:
+        raise ValueError(f"Not a fake7z archive: {path}")
+    return data
+
+
+def make_launcher(dest_dir):
+    """在 dest_dir 中生成可直接执行的 7z 替身，返回其路径"""
+    script = os.path.abspath(__file__)
+    if os.name == "nt":
+        path = os.path.join(dest_dir, "7z.bat")
+        with open(path, "w", encoding="ascii") as f:
+            f.write(f'@"{sys.executable}" "{script}" %*\n')
+    else:
+        path = os.path.join(dest_dir, "7z")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+def simulate_io(total_bytes):
+    mbps = float(os.environ.get("FAKE7Z_MBPS", 0))
+    if mbps > 0:
+        time.sleep(total_bytes / (mbps * 1024 * 1024))
+
+
+def split_args(argv):
+    switches, positional = {}, []
+    for arg in argv:
+        if arg.startswith("-") and len(arg) > 1:
+            name = arg[1:3] if arg[1:3] in ("mx", "mh") else arg[1]
+            switches[name] = arg[1 + len(name):]
+        else:
+            positional.append(arg)
+    return switches, positional
+
+
+def extract(switches, positional):
+    if len(positional) != 1:
+        print("Command Line Error: expected one archive", file=sys.stderr)
+        return 7
+    try:
+        archive = read_archive(positional[0])
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    if archive["password"] and switches.get("p") != archive["password"]:
+        time.sleep(float(os.environ.get("FAKE7Z_WRONG_LATENCY", 0)))
+        print(f"ERROR: Wrong password : {positional[0]}", file=sys.stderr)
+        return 2
+
+    output_dir = switches.get("o", ".")
+    for name, size in archive["files"].items():
+        path = os.path.join(output_dir, name)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.truncate(size)
+    simulate_io(sum(archive["files"].values()))
+    return 0
+
+
+def compress(switches, positional):
+    if len(positional) < 2:
+        print("Command Line Error: expected archive and source", file=sys.stderr)
+        return 7
+    out_file, sources = positional[0], positional[1:]
+
+    files = {}
+    for source in sources:
+        base = os.path.dirname(os.path.abspath(source))
+        for root, _, filenames in os.walk(source):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                files[os.path.relpath(path, base)] = os.path.getsize(path)
+
+    if "v" in switches:
+        out_file += ".001"
+    write_archive(out_file, files, switches.get("p") or None)
+    simulate_io(sum(files.values()))
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    time.sleep(float(os.environ.get("FAKE7Z_LATENCY", 0)))
+    if not argv or argv[0] not in ("x", "a"):
+        print("Command Line Error: unsupported command", file=sys.stderr)
+        return 7
+    switches, positional = split_args(argv[1:])
+    return extract(switches, positional) if argv[0] == "x" else compress(switches, positional)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
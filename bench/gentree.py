@@ -0,0 +1,163 @@
+"""可复现的合成目录树生成器
+
+相同参数和种子总是生成相同的目录结构与文件内容，用于基准测试：
+  - 文件数量、大小分布（fixed / uniform / lognormal）
+  - 重复文件比例（内容与之前某个文件完全相同）
+  - 目录嵌套深度与每层子目录数
+  - 硬链接比例（指向之前某个文件的硬链接）
+以及供 un7z 使用的假压缩包（见 fake7z.py）。
+
+用法: python bench/gentree.py <目标目录> [-n 文件数] [--dist lognormal] [--dup-ratio 0.2] ... [--force]
+目标目录必须不存在或为空；--force 会先清空它。
+"""
+import os
+import sys
+import random
+import shutil
+import hashlib
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake7z import write_archive  # noqa: E402
+
+SIZE_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+BLOCK_SIZE = 1024 * 1024
+MIN_UNIQUE_SIZE = 16  # 头尾各 8 字节序号，保证非重复文件内容互不相同
+
+
+def pick_size(rng, dist, mean_size):
+    if dist == "fixed":
+        return mean_size
+    if dist == "uniform":
+        return rng.randint(0, 2 * mean_size)
+    # lognormal：中位数约为 mean_size 的一半，少量大文件拉高均值
+    return min(int(rng.lognormvariate(0, 1.2) * mean_size / 2), 64 * mean_size)
+
+
+def make_dirs(root, depth, fanout):
+    """生成 depth 层、每层 fanout 个子目录，返回全部目录（含根目录）"""
+    dirs, level = [root], [root]
+    for d in range(depth):
+        level = [os.path.join(parent, f"d{d}_{i}") for parent in level for i in range(fanout)]
+        dirs.extend(level)
+    for path in dirs:
+        os.makedirs(path, exist_ok=True)
+    return dirs
+
+
+def file_content(rng, block, index, size):
+    """唯一文件内容：头尾写入序号，中间取共享随机块的一段（size 不小于 MIN_UNIQUE_SIZE）"""
+    marker = index.to_bytes(8, "little")
+    body_size = size - MIN_UNIQUE_SIZE
+    offset = rng.randrange(len(block))
+    if offset + body_size <= len(block):
+        body = block[offset:offset + body_size]
+    else:
+        body = (block[offset:] + block * (body_size // len(block) + 1))[:body_size]
+    return marker + body + marker
+
+
+def generate_tree(root, files=1000, dist="lognormal", mean_size=64 * 1024, dup_ratio=0.2,
+                  depth=2, fanout=4, hardlink_ratio=0.0, seed=0):
+    """生成合成目录树，返回统计信息 {files, bytes, dirs, duplicates, hardlinks, collisions}
+
+    非重复文件至少 MIN_UNIQUE_SIZE 字节；collisions 为内容意外与之前文件相同的非重复文件数，正常应为 0。
+    """
+    if dist not in SIZE_DISTRIBUTIONS:
+        raise ValueError(f"Unknown size distribution: {dist}")
+    rng = random.Random(seed)
+    block = rng.getrandbits(8 * BLOCK_SIZE).to_bytes(BLOCK_SIZE, "little")
+    dirs = make_dirs(root, depth, fanout)
+
+    stats = {"files": 0, "bytes": 0, "dirs": len(dirs), "duplicates": 0, "hardlinks": 0, "collisions": 0}
+    digests = set()
+    originals = []  # 非重复文件的路径；重复文件从磁盘读取内容，避免整棵树驻留内存
+    for index in range(files):
+        path = os.path.join(rng.choice(dirs), f"f{index:06d}.bin")
+        roll = rng.random()
+        if originals and roll < hardlink_ratio:
+            source = rng.choice(originals)
+            os.link(source, path)
+            stats["hardlinks"] += 1
+            stats["files"] += 1
+            stats["bytes"] += os.path.getsize(source)
+            continue
+        if originals and roll < hardlink_ratio + dup_ratio:
+            with open(rng.choice(originals), "rb") as f:
+                content = f.read()
+            stats["duplicates"] += 1
+        else:
+            size = max(pick_size(rng, dist, mean_size), MIN_UNIQUE_SIZE)
+            content = file_content(rng, block, index, size)
+            digest = hashlib.blake2b(content, digest_size=16).digest()
+            if digest in digests:
+                stats["collisions"] += 1
+            digests.add(digest)
+            originals.append(path)
+        with open(path, "wb") as f:
+            f.write(content)
+        stats["files"] += 1
+        stats["bytes"] += len(content)
+    return stats
+
+
+def generate_archives(root, count=100, files_per_archive=10, mean_size=64 * 1024,
+                      passwords=(), encrypted_ratio=0.5, unknown_ratio=0.0, seed=0):
+    """生成假压缩包（*.7z），密码从 passwords 中随机选取
+
+    encrypted_ratio 为加密包比例；unknown_ratio 为使用列表外密码（必然解压失败）的比例。
+    返回统计信息 {files, bytes, encrypted, unknown}，其中 files 为压缩包数量、bytes 为解压后总字节数。
+    """
+    rng = random.Random(seed)
+    os.makedirs(root, exist_ok=True)
+    stats = {"files": 0, "bytes": 0, "encrypted": 0, "unknown": 0}
+    for index in range(count):
+        members = {
+            f"a{index:05d}/m{i:03d}.bin": pick_size(rng, "uniform", mean_size)
+            for i in range(files_per_archive)
+        }
+        roll = rng.random()
+        if roll < unknown_ratio:
+            password = f"unknown-{index}"
+            stats["unknown"] += 1
+        elif passwords and roll < unknown_ratio + encrypted_ratio:
+            password = rng.choice(passwords)
+            stats["encrypted"] += 1
+        else:
+            password = None
+        write_archive(os.path.join(root, f"a{index:05d}.7z"), members, password)
+        stats["files"] += 1
+        stats["bytes"] += sum(members.values())
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a reproducible synthetic file tree")
+    parser.add_argument("target", help="Directory to create the tree in")
+    parser.add_argument("-n", "--files", type=int, default=1000, help="Number of files")
+    parser.add_argument("--dist", default="lognormal", choices=SIZE_DISTRIBUTIONS, help="File size distribution")
+    parser.add_argument("--size", type=int, default=64 * 1024, help="Mean file size in bytes")
+    parser.add_argument("--dup-ratio", type=float, default=0.2, help="Fraction of duplicate files")
+    parser.add_argument("--depth", type=int, default=2, help="Directory nesting depth")
+    parser.add_argument("--fanout", type=int, default=4, help="Subdirectories per directory")
+    parser.add_argument("--hardlink-ratio", type=float, default=0.0, help="Fraction of hardlinks")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("-f", "--force", action="store_true", help="Delete the target's contents first")
+    args = parser.parse_args()
+
+    # 与旧文件混在一起会使统计失真，硬链接还会因目标已存在而失败
+    if os.path.exists(args.target) and not os.path.isdir(args.target):
+        sys.exit(f"Error: Target is not a directory - {args.target}")
+    if os.path.isdir(args.target) and os.listdir(args.target):
+        if not args.force:
+            sys.exit(f"Error: Target directory is not empty - {args.target} (use --force to clear it)")
+        shutil.rmtree(args.target)
+
+    stats = generate_tree(args.target, args.files, args.dist, args.size, args.dup_ratio,
+                          args.depth, args.fanout, args.hardlink_ratio, args.seed)
+    print(f"Generated {stats['files']} files ({stats['bytes'] / 1024 / 1024:.1f} MB) in {stats['dirs']} dirs: "
+          f"{stats['duplicates']} duplicates, {stats['hardlinks']} hardlinks, {stats['collisions']} collisions")
+
+
+if __name__ == "__main__":
+    main()
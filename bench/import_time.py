@@ -0,0 +1,99 @@
+"""测量各子命令的导入耗时与 pytools 启动耗时
+
+这些脚本每天会被其他脚本调用成千上万次，启动开销会不断累积。
+本脚本对每个子命令：
+  - 用 ``python -X importtime`` 取模块的累计导入时间
+  - 用 ``python -c "import <command>"`` 取启动并导入的墙钟时间
+并与空解释器（``python -c pass``）及 ``pytools -h`` 的启动时间对比，均取中位数。
+不会真正执行子命令（dedup/flatdir 等会直接处理当前目录）。
+
+用法: python bench/import_time.py [-n 轮数] [--json 输出文件]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(ROOT_DIR, "scripts")
+
+sys.path.insert(0, ROOT_DIR)
+from scripts.__main__ import COMMANDS  # noqa: E402  pytools 的子命令表
+
+
+def import_time_us(module):
+    """单次运行：返回模块的累计导入时间（微秒）"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SCRIPTS_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip()}")
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"No importtime entry for {module}")
+
+
+def startup_ms(args):
+    """单次运行：返回一次解释器启动到退出的墙钟时间（毫秒）"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *args],
+        cwd=SCRIPTS_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        stdin=subprocess.DEVNULL,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def median_of(func, arg, rounds):
+    return statistics.median(func(arg) for _ in range(rounds))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark for pytools subcommands")
+    parser.add_argument("-n", "--rounds", type=int, default=10, help="Runs per measurement (median is reported)")
+    parser.add_argument("--json", help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    baseline = median_of(startup_ms, ["-c", "pass"], args.rounds)
+    dispatcher = median_of(startup_ms, [".", "-h"], args.rounds)
+    results = {"python": sys.version.split()[0], "rounds": args.rounds,
+               "baseline_startup_ms": round(baseline, 2),
+               "dispatcher_startup_ms": round(dispatcher, 2), "commands": {}}
+
+    print(f"Python {results['python']} | {args.rounds} rounds")
+    print(f"bare interpreter: {baseline:.1f} ms | pytools -h: {dispatcher:.1f} ms\n")
+    print(f"{'command':10} {'import ms':>10} {'startup ms':>11} {'overhead ms':>12}")
+    for name in COMMANDS:
+        try:
+            imp = median_of(import_time_us, name, args.rounds) / 1000
+        except RuntimeError as e:
+            print(f"{name:10} ✗ {e}")
+            continue
+        start = median_of(startup_ms, ["-c", f"import {name}"], args.rounds)
+        results["commands"][name] = {
+            "import_ms": round(imp, 2),
+            "startup_ms": round(start, 2),
+            "overhead_ms": round(start - baseline, 2),
+        }
+        print(f"{name:10} {imp:10.2f} {start:11.1f} {start - baseline:12.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""在独立的小进程中运行命令，记录耗时、峰值 RSS 与退出码
+
+Linux 的 ru_maxrss 会跨 fork/exec 继承父进程的内存峰值：若直接由基准测试主进程
+（生成目录树后内存较大）启动工具，所有工具的峰值 RSS 都会等于主进程的峰值。
+由本脚本作为中间进程启动工具后，RUSAGE_CHILDREN 只反映工具及其子进程的峰值。
+
+Windows 没有 RUSAGE_CHILDREN，改为在子进程句柄关闭前通过 GetProcessMemoryInfo
+读取其 PeakWorkingSetSize；只包含工具进程本身，不含它启动的 7z 等子进程。
+
+用法: python measure.py <结果文件> <命令> [参数...]
+结果文件内容: {"seconds": 秒, "peak_rss": 字节数或 null, "returncode": 退出码}
+"""
+import sys
+import json
+import time
+import subprocess
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def read_windows_peak_rss(handle):
+    """读取进程句柄对应进程的峰值工作集（字节），失败时返回 None"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    psapi = ctypes.WinDLL("psapi", use_last_error=True)
+    psapi.GetProcessMemoryInfo.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+    psapi.GetProcessMemoryInfo.restype = wintypes.BOOL
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    if not psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize
+
+
+def main():
+    result_path, cmd = sys.argv[1], sys.argv[2:]
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd)
+    returncode = proc.wait()
+    seconds = time.perf_counter() - start
+
+    peak_rss = None
+    if resource is not None:
+        # ru_maxrss：Linux 为 KB，macOS 为字节
+        peak_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        if sys.platform != "darwin":
+            peak_rss *= 1024
+    elif sys.platform == "win32":
+        # wait() 之后 Popen 仍持有进程句柄，已退出进程的内存计数在句柄关闭前依然可读
+        peak_rss = read_windows_peak_rss(int(proc._handle))
+
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump({"seconds": seconds, "peak_rss": peak_rss, "returncode": returncode}, f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""脚本基准测试
+
+每个工具每轮都在全新的合成目录树上运行（生成时间不计入），记录：
+  files/s    每秒处理的条目数（un7z 为压缩包数，cpr7z 为待压缩目录数，其余为文件数）
+  MB/s       每秒处理的数据量（un7z 为解压后字节数）
+  peak RSS   工具的峰值内存（见 measure.py；Linux/macOS 含其子进程，Windows 仅工具进程本身）
+un7z / cpr7z 使用 fake7z.py 作为 7z 替身，可离线运行。
+
+每轮运行后检查工具的输出（剩余文件数、解压目录数等）；不符合预期的工具记为 failed，不给出吞吐量。
+结果以 JSON 保存（默认 bench/results/<commit>.json），用 --compare 与其他提交的结果对比。
+
+用法: python bench/run.py [dedup un7z ...] [-n 轮数] [--files 2000] [--compare 旧结果.json]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+SCRIPTS_DIR = os.path.join(ROOT_DIR, "scripts")
+
+sys.path.insert(0, BENCH_DIR)
+from fake7z import make_launcher  # noqa: E402
+from gentree import SIZE_DISTRIBUTIONS, generate_tree, generate_archives  # noqa: E402
+
+PASSWORDS = ["alpha", "bravo", "charlie", "delta"]
+
+
+def script(name):
+    return [sys.executable, os.path.join(SCRIPTS_DIR, f"{name}.py")]
+
+
+def tree_options(opts, **overrides):
+    params = {
+        "files": opts.files, "dist": opts.dist, "mean_size": opts.size, "dup_ratio": opts.dup_ratio,
+        "depth": opts.depth, "fanout": opts.fanout, "hardlink_ratio": opts.hardlink_ratio, "seed": opts.seed,
+    }
+    params.update(overrides)
+    return params
+
+
+def list_files(root):
+    return [os.path.join(r, f) for r, _, files in os.walk(root) for f in files]
+
+
+def expect(label, actual, expected):
+    """输出检查：不符合时返回错误说明，否则返回 None"""
+    return None if actual == expected else f"{label}: expected {expected}, got {actual}"
+
+
+# 每个 setup_* 在 work 目录中准备输入，返回 {cmd, cwd, stdin, files, bytes, check}
+# check() 在工具运行后检查输出；返回错误说明时该工具记为失败，不计算吞吐量
+def setup_dedup(work, opts):
+    tree = os.path.join(work, "tree")
+    stats = generate_tree(tree, **tree_options(opts))
+    remaining = stats["files"] - stats["duplicates"] - stats["hardlinks"] - stats["collisions"]
+    return {"cmd": script("dedup") + ["-r", "-y"], "cwd": tree, **stats,
+            "check": lambda: expect("files left", len(list_files(tree)), remaining)}
+
+
+def setup_asfx(work, opts):
+    tree = os.path.join(work, "tree")
+    stats = generate_tree(tree, **tree_options(opts))
+    renamed = lambda: sum(path.endswith("_bak") for path in list_files(tree))  # noqa: E731
+    return {"cmd": script("asfx") + ["-s", "_bak", "-d", tree, "-r"], "cwd": work, **stats,
+            "check": lambda: expect("files renamed", renamed(), stats["files"])}
+
+
+def setup_rmtext(work, opts):
+    tree = os.path.join(work, "tree")
+    stats = generate_tree(tree, **tree_options(opts))
+    matching = lambda: sum("f0" in os.path.basename(path) for path in list_files(tree))  # noqa: E731
+    expected = matching()
+    return {"cmd": script("rmtext") + [tree, "f0", "-r"], "cwd": work, **stats,
+            "check": lambda: expect("files renamed", expected - matching(), expected)}
+
+
+def setup_rptext(work, opts):
+    tree = os.path.join(work, "tree")
+    stats = generate_tree(tree, **tree_options(opts))
+    matching = lambda: sum("f0" in os.path.basename(path) for path in list_files(tree))  # noqa: E731
+    expected = matching()
+    return {"cmd": script("rptext"), "cwd": tree, "stdin": "f0\nr0\n", **stats,
+            "check": lambda: expect("files renamed", expected - matching(), expected)}
+
+
+def setup_dirpfx(work, opts):
+    tree = os.path.join(work, "tree")
+    stats = generate_tree(tree, **tree_options(opts))
+
+    def prefixed():
+        return sum(
+            os.path.basename(path).startswith(os.path.basename(os.path.dirname(path)) + "-")
+            for path in list_files(tree) if os.path.dirname(path) != tree
+        )
+
+    expected = sum(os.path.dirname(path) != tree for path in list_files(tree))
+    return {"cmd": script("dirpfx"), "cwd": tree, **stats,
+            "check": lambda: expect("files prefixed", prefixed(), expected)}
+
+
+def setup_flatdir(work, opts):
+    tree = os.path.join(work, "tree")
+    stats = generate_tree(tree, **tree_options(opts))
+
+    def depths():
+        return sorted(os.path.relpath(path, tree).count(os.sep) for path in list_files(tree))
+
+    # flatdir 把根目录以下的每个文件上移一层
+    expected = sorted(max(depth - 1, 0) for depth in depths())
+    return {"cmd": script("flatdir"), "cwd": tree, **stats,
+            "check": lambda: expect("file depths", depths(), expected)}
+
+
+def setup_fclass(work, opts):
+    tree = os.path.join(work, "tree")
+    stats = generate_tree(tree, **tree_options(opts, depth=0))
+    moved = lambda: sum(os.path.dirname(path) != tree for path in list_files(tree))  # noqa: E731
+    return {"cmd": script("fclass"), "cwd": tree, **stats,
+            "check": lambda: expect("files moved", moved(), stats["files"])}
+
+
+def setup_un7z(work, opts):
+    archives = os.path.join(work, "archives")
+    out = os.path.join(work, "out")
+    stats = generate_archives(archives, opts.archives, mean_size=opts.size, passwords=PASSWORDS,
+                              encrypted_ratio=opts.encrypted_ratio, unknown_ratio=opts.unknown_ratio,
+                              seed=opts.seed)
+    config = os.path.join(work, "passwords.json")
+    with open(config, "w", encoding="utf-8") as f:
+        json.dump(PASSWORDS, f)
+    sevenz = make_launcher(work)
+    cmd = script("un7z") + [archives, "-c", config, "-7", sevenz, "-o", out]
+    extracted = lambda: len(os.listdir(out)) if os.path.isdir(out) else 0  # noqa: E731
+    return {"cmd": cmd, "cwd": work, **stats,
+            "check": lambda: expect("archives extracted", extracted(), stats["files"] - stats["unknown"])}
+
+
+def setup_cpr7z(work, opts):
+    tree = os.path.join(work, "tree")
+    out = os.path.join(work, "out")
+    stats = generate_tree(tree, **tree_options(opts, depth=max(opts.depth, 1)))
+    sevenz = make_launcher(work)
+    cmd = script("cpr7z") + [tree, "-7", sevenz, "-o", out, "-p", PASSWORDS[0]]
+    # cpr7z 按顶层子目录逐个压缩，根目录下的文件不会被处理
+    stats["files"] = opts.fanout
+    stats["bytes"] = sum(os.path.getsize(path) for path in list_files(tree) if os.path.dirname(path) != tree)
+    created = lambda: len(os.listdir(out)) if os.path.isdir(out) else 0  # noqa: E731
+    return {"cmd": cmd, "cwd": work, **stats,
+            "check": lambda: expect("archives created", created(), opts.fanout)}
+
+
+SCENARIOS = {
+    "dedup": setup_dedup,
+    "asfx": setup_asfx,
+    "rmtext": setup_rmtext,
+    "rptext": setup_rptext,
+    "dirpfx": setup_dirpfx,
+    "flatdir": setup_flatdir,
+    "fclass": setup_fclass,
+    "un7z": setup_un7z,
+    "cpr7z": setup_cpr7z,
+}
+
+
+def run_measured(cmd, cwd, stdin=None, env=None):
+    """通过 measure.py 运行命令，返回 {seconds, peak_rss, returncode}"""
+    fd, result_path = tempfile.mkstemp(prefix="bench_", suffix=".json")
+    os.close(fd)
+    try:
+        subprocess.run(
+            [sys.executable, os.path.join(BENCH_DIR, "measure.py"), result_path, *cmd],
+            cwd=cwd, env=env,
+            input=stdin.encode("utf-8") if stdin else None,
+            stdin=None if stdin else subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        with open(result_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.remove(result_path)
+
+
+def bench_tool(name, opts, env):
+    timings, peaks, returncodes, failures = [], [], set(), []
+    for _ in range(opts.rounds):
+        work = tempfile.mkdtemp(prefix=f"bench_{name}_")
+        try:
+            case = SCENARIOS[name](work, opts)
+            measured = run_measured(case["cmd"], case["cwd"], case.get("stdin"), env)
+            error = case["check"]()
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+        if error:
+            failures.append(error)
+        timings.append(measured["seconds"])
+        if measured["peak_rss"] is not None:
+            peaks.append(measured["peak_rss"])
+        returncodes.add(measured["returncode"])
+
+    seconds = statistics.median(timings)
+    result = {
+        "files": case["files"],
+        "bytes": case["bytes"],
+        "seconds": round(seconds, 4),
+        "files_per_s": None,
+        "mb_per_s": None,
+        "peak_rss_mb": round(max(peaks) / 1024 / 1024, 1) if peaks else None,
+        "returncodes": sorted(returncodes),
+        "failed": failures[0] if failures else None,
+    }
+    # 输出不符合预期时耗时没有意义，不给出吞吐量
+    if not failures:
+        result["files_per_s"] = round(case["files"] / seconds, 1)
+        result["mb_per_s"] = round(case["bytes"] / seconds / 1024 / 1024, 2)
+    return result
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline.get('commit', '?')} ({baseline_path}):")
+    for name, result in results["tools"].items():
+        old = baseline.get("tools", {}).get(name)
+        if result.get("failed") or (old and old.get("failed")):
+            print(f"  {name:8} (failed run, not compared)")
+            continue
+        if not old:
+            print(f"  {name:8} (no baseline)")
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        print(f"  {name:8} {old['seconds']:8.3f}s -> {result['seconds']:8.3f}s  x{ratio:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark py_tools scripts on synthetic trees")
+    parser.add_argument("tools", nargs="*", help=f"Tools to benchmark (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("-n", "--rounds", type=int, default=3, help="Runs per tool (median is reported)")
+    parser.add_argument("--files", type=int, default=2000, help="Files per generated tree")
+    parser.add_argument("--dist", default="lognormal", choices=SIZE_DISTRIBUTIONS, help="File size distribution")
+    parser.add_argument("--size", type=int, default=64 * 1024, help="Mean file size in bytes")
+    parser.add_argument("--dup-ratio", type=float, default=0.2, help="Fraction of duplicate files")
+    parser.add_argument("--depth", type=int, default=2, help="Directory nesting depth")
+    parser.add_argument("--fanout", type=int, default=4, help="Subdirectories per directory")
+    parser.add_argument("--hardlink-ratio", type=float, default=0.0, help="Fraction of hardlinks")
+    parser.add_argument("--archives", type=int, default=100, help="Archives generated for un7z")
+    parser.add_argument("--encrypted-ratio", type=float, default=0.5, help="Fraction of archives with a known password")
+    parser.add_argument("--unknown-ratio", type=float, default=0.1, help="Fraction of archives with an unknown password")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake 7z latency per call (seconds)")
+    parser.add_argument("--wrong-latency", type=float, default=0.0, help="Extra fake 7z latency on a wrong password")
+    parser.add_argument("--mbps", type=float, default=0.0, help="Fake 7z throughput in MB/s (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("-o", "--output", help="Result JSON path (default: bench/results/<commit>.json)")
+    parser.add_argument("--compare", help="Previous result JSON to compare against")
+    opts = parser.parse_args()
+    unknown = [name for name in opts.tools if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown tools: {', '.join(unknown)}")
+
+    env = dict(os.environ, FAKE7Z_LATENCY=str(opts.latency),
+               FAKE7Z_WRONG_LATENCY=str(opts.wrong_latency), FAKE7Z_MBPS=str(opts.mbps))
+    commit = git_commit()
+    results = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "options": {k: v for k, v in vars(opts).items() if k not in ("tools", "output", "compare")},
+        "tools": {},
+    }
+
+    print(f"{'tool':8} {'seconds':>8} {'files/s':>10} {'MB/s':>8} {'peak RSS':>9}")
+    for name in opts.tools or SCENARIOS:
+        result = bench_tool(name, opts, env)
+        results["tools"][name] = result
+        rss = f"{result['peak_rss_mb']:.1f}M" if result["peak_rss_mb"] is not None else "-"
+        warn = "" if result["returncodes"] == [0] else f"  ! exit {result['returncodes']}"
+        if result["failed"]:
+            print(f"{name:8} {result['seconds']:8.3f}  ✗ FAILED: {result['failed']}{warn}")
+            continue
+        print(f"{name:8} {result['seconds']:8.3f} {result['files_per_s']:10.1f} "
+              f"{result['mb_per_s']:8.2f} {rss:>9}{warn}")
+
+    output = opts.output or os.path.join(BENCH_DIR, "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved: {output}")
+
+    if opts.compare:
+        print_comparison(results, opts.compare)
+
+
+if __name__ == "__main__":
+    main()
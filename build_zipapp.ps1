@@ -0,0 +1,43 @@
+Write-Output "Starting zipapp builder..."
+
+# Get script root directory
+$currentDir = if ($PSScriptRoot) { $PSScriptRoot } else { $pwd.Path }
+Write-Output "Working directory: $currentDir"
+
+# Configure paths
+$pyDir = Join-Path -Path $currentDir -ChildPath "scripts"
+$outputDir = Join-Path -Path $currentDir -ChildPath "dist"
+$pyzFile = Join-Path -Path $outputDir -ChildPath "pytools.pyz"
+
+# Validate paths
+Write-Output "Checking Python scripts directory: $pyDir"
+if (-Not (Test-Path (Join-Path $pyDir "__main__.py"))) {
+    Write-Output "[ERROR] Missing entry point: $pyDir\__main__.py"
+    exit 1
+}
+
+# Create output directory
+if (-Not (Test-Path $outputDir)) {
+    New-Item -ItemType Directory -Path $outputDir -Force | Out-Null
+    Write-Output "[INFO] Created output directory: $outputDir"
+}
+
+# Pack scripts\ as the archive root; __main__.py dispatches to the subcommands.
+# __pycache__ is skipped so the archive only holds sources.
+$buildCode = @"
+import sys, zipapp
+zipapp.create_archive(
+    sys.argv[1], sys.argv[2],
+    interpreter='/usr/bin/env python3',
+    filter=lambda p: '__pycache__' not in p.parts,
+)
+"@
+
+python -c $buildCode $pyDir $pyzFile
+if ($LASTEXITCODE -ne 0) {
+    Write-Output "[ERROR] Failed to create $pyzFile"
+    exit 1
+}
+
+Write-Output "[SUCCESS] Created: $pyzFile"
+Write-Output "`nUsage: python `"$pyzFile`" <command> [args...]"
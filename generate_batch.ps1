@@ -22,7 +22,8 @@ if (-Not (Test-Path $outputDir)) {
 }
 
 # Process files
-$pythonFiles = Get-ChildItem -Path $pyDir -Filter *.py 
+# Skip package files (__init__.py / __main__.py); pytools itself is built by build_zipapp.ps1
+$pythonFiles = Get-ChildItem -Path $pyDir -Filter *.py | Where-Object { -Not $_.BaseName.StartsWith("_") }
 Write-Output "Found $($pythonFiles.Count) Python files to process"
 
 if ($pythonFiles.Count -eq 0) {
@@ -0,0 +1,5 @@
+"""py_tools: useful scripts for windows using python.
+
+Each module in this package is also a standalone script; ``pytools`` (see
+``__main__.py``) dispatches to them as subcommands.
+"""
@@ -0,0 +1,64 @@
+"""pytools: 所有脚本的统一入口
+
+用法: pytools <command> [args...] [--stats PATH [--stats-format jsonl|prom]] [--profile PATH]
+
+只导入所选子命令对应的模块，启动开销只等于该脚本本身的导入开销。
+支持三种运行方式：
+  pytools dedup -r          （pip 安装后的命令）
+  python scripts dedup -r   （直接运行 scripts 目录）
+  python pytools.pyz dedup  （zipapp，见 build_zipapp.ps1）
+--stats / --profile 对所有子命令有效，见 _stats.py。
+"""
+import sys
+import importlib
+
+try:
+    from ._stats import run
+except ImportError:  # 直接运行 scripts 目录或 zipapp
+    from _stats import run
+
+# 子命令 -> 简要说明；模块名与子命令同名，仅在被选中时才导入
+COMMANDS = {
+    "asfx": "在完整文件名后追加后缀",
+    "cpr7z": "将子目录批量压缩为 7z/zip",
+    "dedup": "查找并删除重复文件",
+    "dirpfx": "以所在文件夹名为文件名添加前缀",
+    "fclass": "按文件名将文件归类到子文件夹",
+    "flatdir": "将子目录中的文件移动到上一级目录",
+    "rmtext": "从文件名中删除指定文本",
+    "rptext": "替换文件名中的指定文本",
+    "un7z": "批量解压 7z/zip（支持密码列表）",
+}
+
+
+def load_command(name):
+    """按需导入子命令模块"""
+    module = f"{__package__}.{name}" if __package__ else name
+    return importlib.import_module(module)
+
+
+def print_usage(file=sys.stdout):
+    print("usage: pytools <command> [args...] [--stats PATH] [--profile PATH]\n\ncommands:", file=file)
+    for name, summary in COMMANDS.items():
+        print(f"  {name:10} {summary}", file=file)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print_usage(sys.stdout if argv else sys.stderr)
+        return 0 if argv else 1
+
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(f"Error: Unknown command - {name}\n", file=sys.stderr)
+        print_usage(sys.stderr)
+        return 2
+
+    # 子命令脚本直接读取 sys.argv，这里改写成它们单独运行时的形态
+    sys.argv = [f"pytools {name}", *rest]
+    return run(name, load_command(name).main)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+"""脚本共用的运行统计（--stats / --profile）
+
+所有脚本都通过 run() 启动。run() 先从 sys.argv 中取出以下选项，其余参数原样交给脚本：
+  --stats PATH            运行结束后写出统计；PATH 为 - 时写到 stdout
+  --stats-format FORMAT   jsonl：每次运行追加一行 JSON（默认）
+                          prom：Prometheus textfile，原子覆盖写入（PATH 以 .prom 结尾时默认）
+  --profile PATH          在 cProfile 下运行并把结果写入 PATH（pstats 格式）；
+                          PATH 为 - 时向 stderr 打印累计耗时前 20 的函数。只统计主线程
+未指定 --stats 时 STATS 保持关闭，phase()/add()/item() 都是空操作，脚本没有额外开销。
+
+记录内容：
+  phases    各阶段耗时；线程池阶段另有工作线程忙碌时间与利用率
+  counters  脚本上报的计数（bytes_read 等）
+  ops       由审计钩子统计的文件/子进程操作次数（open、os.rename、subprocess.Popen 等）
+  io        读写字节数（rchar/wchar）与读写调用次数（syscr/syscw）：Linux 取自 /proc/self/io，
+            Windows 取自 GetProcessIoCounters（另有 other_ops/other_bytes）；其他平台为 null
+  rusage    本进程与子进程的 CPU 时间、峰值内存、块 I/O 次数（Windows 上没有）
+  items     逐项记录（如 un7z 每个压缩包的尝试次数与耗时）
+"""
+import os
+import sys
+import time
+
+# 计入 ops 的审计事件（见 https://docs.python.org/3/library/audit_events.html）
+AUDITED_OPS = frozenset({
+    "open", "os.listdir", "os.scandir", "os.mkdir", "os.rmdir", "os.remove", "os.rename",
+    "os.link", "os.truncate", "shutil.move", "shutil.copyfile", "shutil.rmtree", "subprocess.Popen",
+})
+FORMATS = ("jsonl", "prom")
+
+
+class _NullPhase:
+    """统计关闭时 phase() 返回的空对象"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def worker(self, fn):
+        return fn
+
+    def busy(self):
+        return self
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Busy:
+    """累计一段工作的耗时到阶段的 busy_seconds"""
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        with self.stats.lock:
+            self.stats.phase_record(self.name)["busy_seconds"] += elapsed
+        return False
+
+
+class _Phase:
+    def __init__(self, stats, name, workers):
+        self.stats = stats
+        self.name = name
+        self.workers = workers
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        with self.stats.lock:
+            record = self.stats.phase_record(self.name)
+            record["seconds"] += elapsed
+            record["calls"] += 1
+            if self.workers:
+                record["workers"] = max(record["workers"], self.workers)
+        return False
+
+    def worker(self, fn):
+        """包装提交给线程池的函数，累计工作线程忙碌时间"""
+        def timed(*args, **kwargs):
+            with self.busy():
+                return fn(*args, **kwargs)
+
+        return timed
+
+    def busy(self):
+        """只计时工作函数中的一段（如跳过等待用户输入的时间）：with phase.busy(): ..."""
+        return _Busy(self.stats, self.name)
+
+
+class Stats:
+    def __init__(self):
+        self.enabled = False
+        self.tool = None
+        self.lock = None
+        self.phases = {}
+        self.counters = {}
+        self.ops = {}
+        self.items = []
+
+    def enable(self, tool):
+        import threading
+
+        self.enabled = True
+        self.tool = tool
+        self.lock = threading.Lock()
+        self.start_time = time.time()
+        self.start = time.perf_counter()
+        self.start_io = read_io()
+        sys.addaudithook(self._audit)
+
+    def _audit(self, event, args):
+        if self.enabled and event in AUDITED_OPS:
+            with self.lock:
+                self.ops[event] = self.ops.get(event, 0) + 1
+
+    def phase(self, name, workers=0):
+        """计时阶段：with STATS.phase("scan"): ...；线程池阶段传入 workers 并用 .worker() 或 .busy() 计时任务"""
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name, workers)
+
+    def phase_record(self, name):
+        if name not in self.phases:
+            self.phases[name] = {"seconds": 0.0, "calls": 0, "busy_seconds": 0.0, "workers": 0}
+        return self.phases[name]
+
+    def add(self, name, value=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def item(self, **fields):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.items.append(fields)
+
+    def snapshot(self, exit_code):
+        ops = dict(self.ops)  # 先复制，后面读取 /proc/self/io 的 open 不计入
+        phases = {}
+        for name, record in self.phases.items():
+            phase = {"seconds": round(record["seconds"], 6), "calls": record["calls"]}
+            if record["workers"]:
+                capacity = record["workers"] * record["seconds"]
+                phase["workers"] = record["workers"]
+                phase["busy_seconds"] = round(record["busy_seconds"], 6)
+                phase["utilisation"] = round(record["busy_seconds"] / capacity, 4) if capacity else 0.0
+            phases[name] = phase
+
+        io = read_io()
+        if io and self.start_io:
+            io = {key: value - self.start_io.get(key, 0) for key, value in io.items()}
+
+        return {
+            "tool": self.tool,
+            "timestamp": round(self.start_time, 3),
+            "seconds": round(time.perf_counter() - self.start, 6),
+            "exit_code": exit_code,
+            "phases": phases,
+            "counters": dict(self.counters),
+            "ops": ops,
+            "io": io,
+            "rusage": read_rusage(),
+            "items": list(self.items),
+        }
+
+
+STATS = Stats()
+
+
+def read_io():
+    """读取本进程的 I/O 计数；Linux 与 Windows 使用相同的 rchar/wchar/syscr/syscw 键，其他平台返回 None"""
+    if os.name == "nt":
+        return read_windows_io()
+    try:
+        with open("/proc/self/io", "r") as f:
+            return {key: int(value) for key, value in (line.split(":") for line in f if ":" in line)}
+    except (OSError, ValueError):
+        return None
+
+
+def read_windows_io():
+    import ctypes
+    from ctypes import wintypes
+
+    class IO_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("ReadOperationCount", ctypes.c_ulonglong),
+            ("WriteOperationCount", ctypes.c_ulonglong),
+            ("OtherOperationCount", ctypes.c_ulonglong),
+            ("ReadTransferCount", ctypes.c_ulonglong),
+            ("WriteTransferCount", ctypes.c_ulonglong),
+            ("OtherTransferCount", ctypes.c_ulonglong),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.GetProcessIoCounters.argtypes = [wintypes.HANDLE, ctypes.POINTER(IO_COUNTERS)]
+    kernel32.GetProcessIoCounters.restype = wintypes.BOOL
+
+    counters = IO_COUNTERS()
+    if not kernel32.GetProcessIoCounters(kernel32.GetCurrentProcess(), ctypes.byref(counters)):
+        return None
+    return {
+        "rchar": counters.ReadTransferCount,
+        "wchar": counters.WriteTransferCount,
+        "syscr": counters.ReadOperationCount,
+        "syscw": counters.WriteOperationCount,
+        "other_ops": counters.OtherOperationCount,
+        "other_bytes": counters.OtherTransferCount,
+    }
+
+
+def read_rusage():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    # ru_maxrss：Linux 为 KB，macOS 为字节
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    usage = {}
+    for who, prefix in ((resource.RUSAGE_SELF, "self"), (resource.RUSAGE_CHILDREN, "children")):
+        ru = resource.getrusage(who)
+        usage[prefix] = {
+            "user_seconds": round(ru.ru_utime, 6),
+            "system_seconds": round(ru.ru_stime, 6),
+            "max_rss_bytes": ru.ru_maxrss * rss_unit,
+            "block_reads": ru.ru_inblock,
+            "block_writes": ru.ru_oublock,
+            "voluntary_switches": ru.ru_nvcsw,
+            "involuntary_switches": ru.ru_nivcsw,
+        }
+    return usage
+
+
+# read_io() 的键 -> (Prometheus 指标名, 说明)
+IO_METRICS = {
+    "rchar": ("pytools_io_read_bytes", "Bytes read by the process over the run, including cache hits."),
+    "wchar": ("pytools_io_write_bytes", "Bytes written by the process over the run."),
+    "syscr": ("pytools_io_read_ops", "Read operations of the process over the run."),
+    "syscw": ("pytools_io_write_ops", "Write operations of the process over the run."),
+    "read_bytes": ("pytools_io_storage_read_bytes", "Bytes fetched from storage over the run (Linux)."),
+    "write_bytes": ("pytools_io_storage_write_bytes", "Bytes sent to storage over the run (Linux)."),
+    "cancelled_write_bytes": ("pytools_io_cancelled_write_bytes",
+                              "Bytes whose storage write was cancelled over the run (Linux)."),
+    "other_ops": ("pytools_io_other_ops", "Non-read/write I/O operations over the run (Windows)."),
+    "other_bytes": ("pytools_io_other_bytes", "Bytes transferred by other I/O operations over the run (Windows)."),
+}
+
+# read_rusage() 的字段（名称已含单位）-> 说明
+RUSAGE_METRICS = {
+    "user_seconds": "User CPU time at exit.",
+    "system_seconds": "System CPU time at exit.",
+    "max_rss_bytes": "Peak resident set size at exit.",
+    "block_reads": "Block input operations at exit.",
+    "block_writes": "Block output operations at exit.",
+    "voluntary_switches": "Voluntary context switches at exit.",
+    "involuntary_switches": "Involuntary context switches at exit.",
+}
+
+
+def format_prometheus(record):
+    labels = f'tool="{record["tool"]}"'
+    lines, declared = [], set()
+
+    def metric(name, value, help_text, extra=""):
+        if name not in declared:
+            declared.add(name)
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name}{{{labels}{extra}}} {value}")
+
+    metric("pytools_run_seconds", record["seconds"], "Wall time of the run.")
+    metric("pytools_run_timestamp_seconds", record["timestamp"], "Unix time the run started.")
+    metric("pytools_run_exit_code", record["exit_code"], "Exit code of the run.")
+    metric("pytools_items", len(record["items"]), "Items recorded by the run.")
+    # 同一指标的样本必须连续输出，因此按指标而非按阶段遍历
+    phases = record["phases"].items()
+    for name, phase in phases:
+        metric("pytools_phase_seconds", phase["seconds"], "Wall time per phase.", f',phase="{name}"')
+    for name, phase in phases:
+        if "utilisation" in phase:
+            metric("pytools_phase_workers", phase["workers"], "Worker threads per phase.", f',phase="{name}"')
+    for name, phase in phases:
+        if "utilisation" in phase:
+            metric("pytools_phase_utilisation", phase["utilisation"], "Worker busy time / capacity.",
+                   f',phase="{name}"')
+    # 单位不同的值（字节、次数、秒）各用一个指标，不放在同一指标的标签下
+    for name, value in record["counters"].items():
+        metric(f"pytools_counter_{name}", value, f"Counter {name} reported by the tool.")
+    for name, value in record["ops"].items():
+        metric("pytools_ops", value, "Audited file and subprocess operations.", f',op="{name}"')
+    for key, value in (record["io"] or {}).items():
+        if key in IO_METRICS:
+            name, help_text = IO_METRICS[key]
+            metric(name, value, help_text)
+    rusage = record["rusage"] or {}
+    for field, help_text in RUSAGE_METRICS.items():
+        for who, usage in rusage.items():
+            if field in usage:
+                metric(f"pytools_rusage_{field}", usage[field], help_text, f',who="{who}"')
+    return "\n".join(lines) + "\n"
+
+
+def write_stats(record, path, fmt):
+    if fmt == "prom":
+        text = format_prometheus(record)
+    else:
+        import json
+        text = json.dumps(record, ensure_ascii=False) + "\n"
+
+    if path == "-":
+        sys.stdout.write(text)
+    elif fmt == "prom":
+        # textfile collector 可能随时读取，先写临时文件再原子替换
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    else:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(text)
+
+
+def pop_options(argv):
+    """从 argv 中取出 --stats / --stats-format / --profile，返回 (剩余参数, 选项字典)"""
+    options, rest = {}, []
+    names = {"--stats": "stats", "--stats-format": "stats_format", "--profile": "profile"}
+    args = iter(argv)
+    for arg in args:
+        name, sep, value = arg.partition("=")
+        if name not in names:
+            rest.append(arg)
+            continue
+        if not sep:
+            value = next(args, None)
+        if not value:  # 缺少值或 --stats= 这样的空值
+            sys.exit(f"Error: {name} requires a value")
+        options[names[name]] = value
+
+    fmt = options.get("stats_format")
+    if fmt is None:
+        fmt = "prom" if options.get("stats", "").endswith(".prom") else "jsonl"
+    if fmt not in FORMATS:
+        sys.exit(f"Error: --stats-format must be one of {', '.join(FORMATS)}")
+    options["stats_format"] = fmt
+    return rest, options
+
+
+def run(tool, main):
+    """解析统计选项后运行 main()；返回 main() 的返回值，SystemExit 等异常照常抛出"""
+    sys.argv[1:], options = pop_options(sys.argv[1:])
+    if "stats" in options:
+        STATS.enable(tool)
+
+    exit_code = 0
+    try:
+        if "profile" in options:
+            return run_profiled(main, options["profile"])
+        return main()
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        raise
+    except BaseException:
+        exit_code = 1
+        raise
+    finally:
+        if STATS.enabled:
+            write_stats(STATS.snapshot(exit_code), options["stats"], options["stats_format"])
+
+
+def run_profiled(main, path):
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(main)
+    finally:
+        if path == "-":
+            import pstats
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(20)
+        else:
+            profiler.dump_stats(path)
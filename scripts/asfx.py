@@ -3,6 +3,11 @@ import os
 import argparse
 import sys
 
+try:
+    from ._stats import run
+except ImportError:  # 作为独立脚本运行
+    from _stats import run
+
 def add_trailing_suffix(directory, suffix, recursive=False):
     """在完整文件名（含扩展名）后追加后缀"""
     for root, _, files in os.walk(directory):
@@ -26,7 +31,7 @@ def add_trailing_suffix(directory, suffix, recursive=False):
             except Exception as e:
                 print(f"Error processing {filename}: {str(e)}")
 
-if __name__ == "__main__":
+def main():
     parser = argparse.ArgumentParser(
         description="在完整文件名后添加后缀（保留原扩展名）",
         epilog="示例：\n  appendsuffix -s \"_backup\"\n  appendsuffix -s \"@v3\" -d \"D:\\Files\" -r",
@@ -44,7 +49,7 @@ if __name__ == "__main__":
         sys.exit(1)
 
     args = parser.parse_args()
-    
+
     if not os.path.isdir(args.directory):
         print(f"错误：目录不存在 - {args.directory}")
         sys.exit(1)
@@ -53,4 +58,8 @@ if __name__ == "__main__":
         directory=args.directory,
         suffix=args.suffix,
         recursive=args.recursive
-    )
\ No newline at end of file
+    )
+
+
+if __name__ == "__main__":
+    run("asfx", main)
@@ -3,7 +3,12 @@ import os
 import json
 import subprocess
 import argparse
-import shlex
+import time
+
+try:
+    from ._stats import STATS, run
+except ImportError:  # 作为独立脚本运行
+    from _stats import STATS, run
 
 SUPPORTED_FORMATS = {
     '7z': {
@@ -69,17 +74,18 @@ def find_targets(root_dir):
 
 def compress(folder, pwd, args):
     fmt = SUPPORTED_FORMATS[args.format]
-    out_file = shlex.quote(os.path.join(args.output, f"{os.path.basename(folder)}.{fmt['ext']}"))
+    out_file = os.path.join(args.output, f"{os.path.basename(folder)}.{fmt['ext']}")
     
+    # 以参数列表直接调用 7z（不经 shell），Windows 上也无需处理引号
     cmd = [
-        shlex.quote(args.sevenz), 'a',
-        f'-t{args.format}', f'-mx{args.compression}',
-        out_file, shlex.quote(folder)
+        args.sevenz, 'a',
+        f'-t{args.format}', f'-mx{args.level}',
+        out_file, folder
     ]
     
     if pwd:
         if not fmt['pwd']: return False
-        cmd.insert(2, f'-p{shlex.quote(pwd)}')
+        cmd.insert(2, f'-p{pwd}')
         if args.encrypt_list: 
             if fmt['enc_list']:
                 cmd.insert(3, '-mhe=on')
@@ -91,7 +97,7 @@ def compress(folder, pwd, args):
         cmd.insert(4, f'-v{args.volume}')
     
     try:
-        subprocess.run(' '.join(cmd), shell=True, check=True, stdout=subprocess.DEVNULL)
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
         status = "[Encrypted]" if pwd else "[Open]"
         status += "+SecureList" if args.encrypt_list else ""
         print(f"✓ {os.path.basename(folder):40} {status}")
@@ -99,6 +105,9 @@ def compress(folder, pwd, args):
     except subprocess.CalledProcessError as e:
         print(f"✗ {os.path.basename(folder):40} [Error {e.returncode}]")
         return False
+    except OSError as e:  # 找不到 7z 等
+        print(f"✗ {os.path.basename(folder):40} [Error: {e}]")
+        return False
 
 def main():
     parser = argparse.ArgumentParser("Batch Compressor")
@@ -124,15 +133,24 @@ def main():
         exit("Error: Encrypt list requires 7z format and password")
     
     # Process
-    targets = find_targets(args.target)
+    with STATS.phase("scan"):
+        targets = find_targets(args.target)
+    STATS.add("folders", len(targets))
     if not targets:
         exit("No directories need compression")
     
     os.makedirs(args.output, exist_ok=True)
     
     pwd = get_password(args)
-    success = sum(compress(f, pwd, args) for f in targets)
+    success = 0
+    with STATS.phase("compress"):
+        for folder in targets:
+            start = time.perf_counter()
+            ok = compress(folder, pwd, args)
+            STATS.item(folder=os.path.basename(folder), seconds=round(time.perf_counter() - start, 6), ok=ok)
+            success += ok
+    STATS.add("folders_compressed", success)
     print(f"\nCompleted: {success} success / {len(targets)} total")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run("cpr7z", main)
\ No newline at end of file
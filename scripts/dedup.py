@@ -1,9 +1,27 @@
 import os
 import sys
-import xxhash
+import threading
+import argparse
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
-from multiprocessing import Manager, Lock
+
+try:
+    from ._stats import STATS, run
+except ImportError:  # 作为独立脚本运行
+    from _stats import STATS, run
+
+# 与 ThreadPoolExecutor 默认值相同，显式给出以便统计工作线程利用率
+HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+DELETE_WORKERS = 4
+
+xxhash = None  # 在 main() 中导入，只导入本模块时不加载
+
+
+class SharedValue:
+    """线程间共享的可变值（替代 multiprocessing.Manager().Value）"""
+
+    def __init__(self, value):
+        self.value = value
 
 def get_fast_hash(filename):
     """快速哈希（头尾抽样）"""
@@ -13,6 +31,7 @@ def get_fast_hash(filename):
             # 读取头16KB
             head = f.read(16384)
             hasher.update(head)
+            bytes_read = len(head)
             
             # 读文件大小并决定是否读取尾部
             file_size = os.path.getsize(filename)
@@ -20,6 +39,8 @@ def get_fast_hash(filename):
                 f.seek(-16384, os.SEEK_END)
                 tail = f.read(16384)
                 hasher.update(tail)
+                bytes_read += len(tail)
+            STATS.add("bytes_read", bytes_read)
                 
             return (file_size, hasher.hexdigest())
     except Exception as e:
@@ -39,6 +60,7 @@ def get_full_hash(filename, expected_size):
         return None
     
     hasher = xxhash.xxh64()
+    bytes_read = 0
     try:
         with open(filename, 'rb') as f:
             while True:
@@ -46,6 +68,8 @@ def get_full_hash(filename, expected_size):
                 if not chunk:
                     break
                 hasher.update(chunk)
+                bytes_read += len(chunk)
+        STATS.add("bytes_read", bytes_read)
         return hasher.hexdigest()
     except Exception as e:
         print(f"全哈希计算失败[{filename}]: {str(e)}")
@@ -75,7 +99,7 @@ def scan_files(current_dir, recursive_mode):
     
     return file_list
 
-def process_group(group, global_auto_confirm, total_deleted, total_deleted_lock):
+def process_group(group, global_auto_confirm, total_deleted, total_deleted_lock, phase):
     """安全处理重复文件组"""
     size, _, full_hash, files = group
     current_dir = os.getcwd()
@@ -98,38 +122,55 @@ def process_group(group, global_auto_confirm, total_deleted, total_deleted_lock)
     
     deleted_count = 0
     if confirm == 'y':
-        for f in to_delete:
-            try:
-                os.remove(f)
-                print(f"✓ 已删除: {os.path.relpath(f, current_dir)}")
-                with total_deleted_lock:
-                    total_deleted.value += 1
-                    deleted_count += 1
-            except Exception as e:
-                print(f"✕ 删除失败[{f}]: {str(e)}")
+        # 只计时删除本身：等待 input() 的时间不算工作线程忙碌
+        with phase.busy():
+            for f in to_delete:
+                try:
+                    # 删除硬链接不释放空间，只有最后一个链接被删除时才计入
+                    last_link = STATS.enabled and os.stat(f).st_nlink == 1
+                    os.remove(f)
+                    if last_link:
+                        STATS.add("bytes_deleted", size)
+                    print(f"✓ 已删除: {os.path.relpath(f, current_dir)}")
+                    with total_deleted_lock:
+                        total_deleted.value += 1
+                        deleted_count += 1
+                except Exception as e:
+                    print(f"✕ 删除失败[{f}]: {str(e)}")
     
     return global_auto_confirm.value
 
 def main():
     # 参数解析
-    recursive_mode = '-r' in sys.argv
-    auto_confirm = '-y' in sys.argv
+    parser = argparse.ArgumentParser(description="Find and delete duplicate files in the current directory")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Scan subdirectories recursively")
+    parser.add_argument("-y", "--yes", action="store_true", help="Delete without asking for confirmation")
+    args = parser.parse_args()
+    recursive_mode = args.recursive
+    auto_confirm = args.yes
+    
+    # 在扫描前导入：缺少依赖时直接报错退出，而不是被逐个文件的异常处理吞掉
+    global xxhash
+    import xxhash
     
-    # 多进程共享资源
-    manager = Manager()
-    total_deleted = manager.Value('i', 0)
-    total_deleted_lock = manager.Lock()
-    auto_confirm_flag = manager.Value('b', auto_confirm)
+    # 线程共享资源（工作线程同属一个进程，无需启动 Manager 服务进程）
+    total_deleted = SharedValue(0)
+    total_deleted_lock = threading.Lock()
+    auto_confirm_flag = SharedValue(auto_confirm)
     
     # 阶段1：快速扫描
     print("🔍 扫描文件中...")
-    all_files = scan_files(os.getcwd(), recursive_mode)
+    with STATS.phase("scan"):
+        all_files = scan_files(os.getcwd(), recursive_mode)
+    STATS.add("files_scanned", len(all_files))
     
     # 阶段2：快速哈希分组
     print("⚡ 快速哈希预处理...")
     fast_hash_map = defaultdict(list)
-    with ThreadPoolExecutor() as executor:
-        futures = {executor.submit(get_fast_hash, f): f for f in all_files}
+    with STATS.phase("fast_hash", workers=HASH_WORKERS) as phase, \
+            ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+        task = phase.worker(get_fast_hash)
+        futures = {executor.submit(task, f): f for f in all_files}
         for future in futures:
             path = futures[future]
             try:
@@ -142,44 +183,55 @@ def main():
     # 阶段3：全哈希校验
     print("🔒 全文件哈希校验...")
     final_groups = []
-    for (file_size, _), candidates in fast_hash_map.items():
-        if len(candidates) < 2:
-            continue
-        
-        # 并行计算全哈希
-        full_hash_map = defaultdict(list)
-        with ThreadPoolExecutor() as executor:
-            futures = {executor.submit(get_full_hash, f, file_size): f for f in candidates}
-            for future in futures:
-                path = futures[future]
-                full_hash = future.result()
-                if full_hash:
-                    full_hash_map[full_hash].append(path)
-        
-        # 生成最终分组
-        for h, files in full_hash_map.items():
-            if len(files) > 1:
-                final_groups.append((file_size, None, h, files))
+    candidate_groups = [
+        (file_size, candidates)
+        for (file_size, _), candidates in fast_hash_map.items()
+        if len(candidates) >= 2
+    ]
+    # 只有存在候选组时才启动线程池，并在各组之间复用同一个池
+    if candidate_groups:
+        with STATS.phase("full_hash", workers=HASH_WORKERS) as phase, \
+                ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+            task = phase.worker(get_full_hash)
+            for file_size, candidates in candidate_groups:
+                # 并行计算全哈希
+                full_hash_map = defaultdict(list)
+                futures = {executor.submit(task, f, file_size): f for f in candidates}
+                for future in futures:
+                    path = futures[future]
+                    full_hash = future.result()
+                    if full_hash:
+                        full_hash_map[full_hash].append(path)
+
+                # 生成最终分组
+                for h, files in full_hash_map.items():
+                    if len(files) > 1:
+                        final_groups.append((file_size, None, h, files))
+    STATS.add("duplicate_groups", len(final_groups))
     
     # 阶段4：处理重复文件
     print("\n🚀 发现", len(final_groups), "个重复文件组")
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = []
-        for group in final_groups:
-            futures.append(
-                executor.submit(
-                    process_group,
-                    group,
-                    auto_confirm_flag,
-                    total_deleted,
-                    total_deleted_lock
+    if final_groups:
+        with STATS.phase("delete", workers=DELETE_WORKERS) as phase, \
+                ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            futures = []
+            for group in final_groups:
+                futures.append(
+                    executor.submit(
+                        process_group,
+                        group,
+                        auto_confirm_flag,
+                        total_deleted,
+                        total_deleted_lock,
+                        phase
+                    )
                 )
-            )
-        for future in futures:
-            future.result()
+            for future in futures:
+                future.result()
+    STATS.add("files_deleted", total_deleted.value)
     
     print(f"\n✅ 完成！共释放 {total_deleted.value} 个重复文件")
 
 if __name__ == "__main__":
     # 运行示例：python dedup.py -r -y
-    main()
+    run("dedup", main)
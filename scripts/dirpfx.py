@@ -1,4 +1,10 @@
 import os
+import argparse
+
+try:
+    from ._stats import run
+except ImportError:  # 作为独立脚本运行
+    from _stats import run
 
 def rename_files_in_directory(directory):
     """
@@ -21,6 +27,14 @@ def rename_files_in_directory(directory):
             except Exception as e:
                 print(f"Failed to rename {old_file_path}: {str(e)}")
 
-if __name__ == "__main__":
+def main():
+    argparse.ArgumentParser(
+        description="Prefix files in subdirectories of the current directory with their folder name"
+    ).parse_args()
+
     # 调用函数，从当前目录开始处理
-    rename_files_in_directory(os.getcwd())
\ No newline at end of file
+    rename_files_in_directory(os.getcwd())
+
+
+if __name__ == "__main__":
+    run("dirpfx", main)
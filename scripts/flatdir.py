@@ -1,5 +1,11 @@
 import os
 import shutil
+import argparse
+
+try:
+    from ._stats import run
+except ImportError:  # 作为独立脚本运行
+    from _stats import run
 
 def move_files_to_parent_directory(directory):
     """
@@ -27,6 +33,14 @@ def move_files_to_parent_directory(directory):
         if not os.listdir(foldername):
             os.rmdir(foldername)
 
-if __name__ == "__main__":
+def main():
+    argparse.ArgumentParser(
+        description="Move files in subdirectories of the current directory up one level and remove emptied folders"
+    ).parse_args()
+
     # 调用函数，从当前目录开始处理
-    move_files_to_parent_directory(os.getcwd())
\ No newline at end of file
+    move_files_to_parent_directory(os.getcwd())
+
+
+if __name__ == "__main__":
+    run("flatdir", main)
@@ -2,6 +2,11 @@
 import os
 import argparse
 
+try:
+    from ._stats import run
+except ImportError:  # 作为独立脚本运行
+    from _stats import run
+
 def rename_files(directory, texts, recursive=False, dry_run=False):
     for root, dirs, files in os.walk(directory) if recursive else [(directory, [], os.listdir(directory))]:
         for name in files + dirs:  # 处理文件和目录
@@ -29,14 +34,18 @@ def rename_files(directory, texts, recursive=False, dry_run=False):
                 except FileExistsError:
                     print(f"Skip: {new_name} already exists")
 
-if __name__ == "__main__":
+def main():
     parser = argparse.ArgumentParser(description="Batch remove multiple texts from filenames")
     parser.add_argument("dir", help="Target directory")
     parser.add_argument("texts", nargs="+", help="Texts to remove (ordered)")
     parser.add_argument("-r", "--recursive", action="store_true", help="Process recursively")
     parser.add_argument("-n", "--dry-run", action="store_true", help="Simulation mode")
     args = parser.parse_args()
-    
+
     rename_files(args.dir, args.texts, args.recursive, args.dry_run)
     # 使用示例
-    # python rptext.py . '删除'
\ No newline at end of file
+    # python rptext.py . '删除'
+
+
+if __name__ == "__main__":
+    run("rmtext", main)
@@ -1,4 +1,10 @@
 import os
+import argparse
+
+try:
+    from ._stats import run
+except ImportError:  # 作为独立脚本运行
+    from _stats import run
 
 def remove_string_from_filenames(directory, target_str, replace_str):
     """
@@ -21,8 +27,16 @@ def remove_string_from_filenames(directory, target_str, replace_str):
                 except Exception as e:
                     print(f"重命名失败: {old_path} -> {new_path} 错误: {e}")
 
-if __name__ == "__main__":
+def main():
+    argparse.ArgumentParser(
+        description="Replace text in file names under the current directory (texts are prompted for)"
+    ).parse_args()
+
     current_dir = '.'
     target_str = input("请输入目标字符串: ")
     replace_str = input("请输入要替换的字符串: ")
-    remove_string_from_filenames(current_dir, target_str, replace_str)
\ No newline at end of file
+    remove_string_from_filenames(current_dir, target_str, replace_str)
+
+
+if __name__ == "__main__":
+    run("rptext", main)
@@ -1,9 +1,15 @@
 import os
 import json
+import time
 import subprocess
 import argparse
 from typing import List
 
+try:
+    from ._stats import STATS, run
+except ImportError:  # 作为独立脚本运行
+    from _stats import STATS, run
+
 
 def load_passwords(config_path):
     try:
@@ -90,9 +96,17 @@ def remove_archive_files(archive_path: str) -> bool:
 def extract(file_path, passwords, sevenz, output_dir):
     base_name = os.path.basename(file_path)
     output_path = os.path.join(output_dir, base_name.split(".")[0])
+    start = time.perf_counter()
+    attempts = 0
+
+    def done(ok):
+        STATS.add("attempts", attempts)
+        STATS.item(archive=base_name, attempts=attempts, seconds=round(time.perf_counter() - start, 6), ok=ok)
+        return ok
 
     # 尝试空密码
     try:
+        attempts += 1
         subprocess.run(
             [sevenz, "x", "-y", f"-o{output_path}", file_path],
             check=True,
@@ -102,7 +116,7 @@ def extract(file_path, passwords, sevenz, output_dir):
         )
         print(f"✓ {base_name:50} [No Password]")
         os.remove(file_path)  # 新增：解压成功后删除源文件
-        return True
+        return done(True)
     except subprocess.CalledProcessError:
         pass
     except Exception as e:  # 捕获删除异常
@@ -111,6 +125,7 @@ def extract(file_path, passwords, sevenz, output_dir):
     # 尝试其他密码
     for idx, pwd in enumerate(passwords, 1):
         try:
+            attempts += 1
             subprocess.run(
                 [sevenz, "x", f"-p{pwd}", "-y", f"-o{output_path}", file_path],
                 check=True,
@@ -121,15 +136,15 @@ def extract(file_path, passwords, sevenz, output_dir):
             print(f"✓ {base_name:50} [P{idx}]")
             # os.remove(file_path)
             remove_archive_files(file_path)
-            return True
+            return done(True)
         except subprocess.CalledProcessError:
             continue
         except Exception as e:  # 捕获删除异常
             print(f"! {base_name:50} [Delete Failed: {str(e)}]")
-            return False  # 删除失败视为整体失败
+            return done(False)  # 删除失败视为整体失败
 
     print(f"✗ {base_name:50} [Failed]")
-    return False
+    return done(False)
 
 
 def main():
@@ -157,7 +172,9 @@ def main():
         exit(1)
 
     passwords = parse_passwords(args)
-    archives = find_archives(args.target)
+    with STATS.phase("scan"):
+        archives = find_archives(args.target)
+    STATS.add("archives", len(archives))
 
     if not archives:
         print("No archives found")
@@ -166,12 +183,14 @@ def main():
     os.makedirs(args.output, exist_ok=True)
 
     success = 0
-    for arch in archives:
-        success += extract(arch, passwords, args.sevenz, args.output)
+    with STATS.phase("extract"):
+        for arch in archives:
+            success += extract(arch, passwords, args.sevenz, args.output)
+    STATS.add("archives_extracted", success)
 
     print(f"\nResults: {success} success / {len(archives)} total")
 
 
 if __name__ == "__main__":
     # python un7z.py .
-    main()
+    run("un7z", main)